@@ -600,6 +600,50 @@ class MinPartitionSize(EnvironmentVariable, type=int):
         return min_partition_size
 
 
+class TaskFusionThreshold(EnvironmentVariable, type=int):
+    """
+    Maximum number of chained ``apply`` calls to fuse into a single remote task.
+
+    While the call queue of a partition is shorter than this value, ``apply``
+    postpones the remote task submission and only records the function, so a
+    chain of applies is executed by a single task once the queue is drained.
+    The default value of 1 dispatches every ``apply`` call eagerly.
+    The option is only read by the partitions of the Ray engine.
+    """
+
+    varname = "MODIN_TASK_FUSION_THRESHOLD"
+    default = 1
+
+    @classmethod
+    def put(cls, value: int) -> None:
+        """
+        Set ``TaskFusionThreshold`` with extra checks.
+
+        Parameters
+        ----------
+        value : int
+            Config value to set.
+        """
+        if value <= 0:
+            raise ValueError(
+                f"Task fusion threshold should be > 0, passed value {value}"
+            )
+        super().put(value)
+
+    @classmethod
+    def get(cls) -> int:
+        """
+        Get ``TaskFusionThreshold`` with extra checks.
+
+        Returns
+        -------
+        int
+        """
+        threshold = super().get()
+        assert threshold > 0, "`threshold` should be > 0"
+        return threshold
+
+
 class TestReadFromSqlServer(EnvironmentVariable, type=bool):
     """Set to true to test reading from SQL server."""
 
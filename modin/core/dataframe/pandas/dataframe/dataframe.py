@@ -186,7 +186,9 @@ class PandasDataframe(ClassLogger):
         if self._row_lengths_cache is None:
             if len(self._partitions.T) > 0:
                 row_parts = self._partitions.T[0]
-                self._row_lengths_cache = [part.length() for part in row_parts]
+                self._row_lengths_cache = self._partition_mgr_cls.get_axis_sizes(
+                    row_parts, axis=0
+                )
             else:
                 self._row_lengths_cache = []
         return self._row_lengths_cache
@@ -218,7 +220,9 @@ class PandasDataframe(ClassLogger):
         if self._column_widths_cache is None:
             if len(self._partitions) > 0:
                 col_parts = self._partitions[0]
-                self._column_widths_cache = [part.width() for part in col_parts]
+                self._column_widths_cache = self._partition_mgr_cls.get_axis_sizes(
+                    col_parts, axis=1
+                )
             else:
                 self._column_widths_cache = []
         return self._column_widths_cache
@@ -1955,6 +1959,13 @@ class PandasDataframe(ClassLogger):
         new_axes_lengths[axis] = [1]
         new_axes_lengths[axis ^ 1] = self._get_axis_lengths(axis ^ 1)
 
+        # Every reduced partition is known to hold a single element along the reduced
+        # axis, propagating it so the partitions do not need to compute it remotely
+        cache_name = "_width_cache" if axis else "_length_cache"
+        for part in new_parts.flatten():
+            if not isinstance(getattr(part, cache_name), int):
+                setattr(part, cache_name, 1)
+
         if dtypes == "copy":
             dtypes = self.copy_dtypes_cache()
         elif dtypes is not None:
@@ -3835,13 +3846,22 @@ class PandasDataframe(ClassLogger):
                     result_col = pandas.concat(valid_cols, axis=0, join="outer").columns
                     return df.reindex(columns=result_col)
 
-                # Getting futures for columns of non-empty partitions
-                cols = [
-                    part.apply(
-                        lambda df: None
+                def get_columns(df):
+                    """Get columns of `df` unless it's marked to be skipped on aligning."""
+                    return (
+                        None
                         if df.attrs.get(skip_on_aligning_flag, False)
                         else df.columns
-                    )._data
+                    )
+
+                if result._partitions.size > 1:
+                    # Putting the function into the storage once instead of serializing
+                    # it for every partition
+                    get_columns = self._partition_mgr_cls.preprocess_func(get_columns)
+
+                # Getting futures for columns of non-empty partitions
+                cols = [
+                    part.apply(get_columns)._data
                     for part in result._partitions.flatten()
                 ]
 
@@ -935,6 +935,55 @@ class PandasDataframePartitionManager(ClassLogger, ABC):
             )
         return [partition.get() for partition in partitions]
 
+    @classmethod
+    def get_axis_sizes(cls, partitions, axis):
+        """
+        Get the sizes of `partitions` along `axis` (in a single call if supported).
+
+        Parameters
+        ----------
+        partitions : np.ndarray
+            NumPy array with ``PandasDataframePartition``-s, may also hold
+            virtual partitions, their sizes are materialized one by one.
+        axis : {0, 1}
+            Axis to get the sizes along: 0 for lengths and 1 for widths.
+
+        Returns
+        -------
+        list of ints
+            The sizes of `partitions` along `axis`.
+
+        Notes
+        -----
+        The sizes that are not materialized yet are requested all at once instead of
+        materializing them one by one, the materialized values are written back to
+        the partitions' caches.
+        """
+        cache_name = "_width_cache" if axis else "_length_cache"
+        if not hasattr(cls, "_execution_wrapper"):
+            return [part.width() if axis else part.length() for part in partitions]
+
+        def get_size(part):
+            # virtual partitions can't return their sizes as futures
+            if not isinstance(part, cls._partition_class):
+                return part.width() if axis else part.length()
+            return (
+                part.width(materialize=False)
+                if axis
+                else part.length(materialize=False)
+            )
+
+        sizes = [get_size(part) for part in partitions]
+        future_idxs = [
+            i for i, size in enumerate(sizes) if not isinstance(size, (int, np.integer))
+        ]
+        if len(future_idxs) > 0:
+            values = cls._execution_wrapper.materialize([sizes[i] for i in future_idxs])
+            for i, value in zip(future_idxs, values):
+                sizes[i] = value
+                setattr(partitions[i], cache_name, value)
+        return sizes
+
     @classmethod
     def wait_partitions(cls, partitions):
         """
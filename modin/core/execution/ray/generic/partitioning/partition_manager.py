@@ -40,12 +40,9 @@ class GenericRayDataframePartitionManager(PandasDataframePartitionManager):
         -------
         NumPy array
         """
+        func = cls.preprocess_func(lambda df, **kwargs: df.to_numpy(**kwargs))
         parts = RayWrapper.materialize(
-            [
-                obj.apply(lambda df, **kwargs: df.to_numpy(**kwargs)).list_of_blocks[0]
-                for row in partitions
-                for obj in row
-            ]
+            [obj.apply(func).list_of_blocks[0] for row in partitions for obj in row]
         )
         n = partitions.shape[1]
         parts = [parts[i * n : (i + 1) * n] for i in list(range(partitions.shape[0]))]
@@ -13,10 +13,15 @@
 
 """Module houses class that wraps data (block partition) and its metadata."""
 
+import logging
+import weakref
+
 import pandas
 import ray
 from ray.util import get_node_ip_address
+from ray.util.client import ray as ray_client
 
+from modin.config import LogMode, TaskFusionThreshold
 from modin.core.dataframe.pandas.partitioning.partition import PandasDataframePartition
 from modin.core.execution.ray.common import RayWrapper
 from modin.core.execution.ray.common.utils import (
@@ -25,9 +30,28 @@ from modin.core.execution.ray.common.utils import (
     reconstruct_call_queue,
 )
 from modin.logging import get_logger
-from modin.pandas.indexing import compute_sliced_len
 
-compute_sliced_len = ray.remote(compute_sliced_len)
+# The logger and its debug mode are cached, so the partition methods don't have
+# to request them on every call, the cache is refreshed on every ``LogMode`` change
+_LOGGER = None
+_IS_DEBUG = False
+
+
+def _update_logger(log_mode):
+    """
+    Refresh the cached logger and its debug mode.
+
+    Parameters
+    ----------
+    log_mode : LogMode
+        The ``LogMode`` config.
+    """
+    global _LOGGER, _IS_DEBUG
+    _LOGGER = get_logger()
+    _IS_DEBUG = _LOGGER.isEnabledFor(logging.DEBUG)
+
+
+LogMode.subscribe(_update_logger)
 
 
 class PandasOnRayDataframePartition(PandasDataframePartition):
@@ -53,16 +77,20 @@ class PandasOnRayDataframePartition(PandasDataframePartition):
     def __init__(self, data, length=None, width=None, ip=None, call_queue=None):
         super().__init__()
         assert isinstance(data, ObjectIDType)
-        self._data = data
+        self._data_ref = data
         if call_queue is None:
             call_queue = []
         self.call_queue = call_queue
         self._length_cache = length
         self._width_cache = width
         self._ip_cache = ip
+        # (weakref to partition, length of its call queue) pairs of the partitions
+        # whose pending call queue is a prefix of this partition's call queue
+        self._fusion_sources = []
+        # weak set of the partitions having this one in their fusion sources
+        self._fusion_consumers = None
 
-        log = get_logger()
-        self._is_debug(log) and log.debug(
+        _IS_DEBUG and _LOGGER.debug(
             "Partition ID: {}, Height: {}, Width: {}, Node IP: {}".format(
                 self._identity,
                 str(self._length_cache),
@@ -71,6 +99,60 @@ class PandasOnRayDataframePartition(PandasDataframePartition):
             )
         )
 
+    def __getstate__(self):
+        """
+        Get the state of the partition to be pickled.
+
+        Returns
+        -------
+        tuple
+            The wrapped reference, the call queue and the metadata caches.
+
+        Notes
+        -----
+        A plain tuple is cheaper to serialize than the whole instance ``__dict__``,
+        which may also hold lazily computed caches that are not worth transferring.
+        """
+        return (
+            self._data_ref,
+            self.call_queue,
+            self._length_cache,
+            self._width_cache,
+            self._ip_cache,
+        )
+
+    def __setstate__(self, state):
+        """
+        Restore the state of the unpickled partition.
+
+        Parameters
+        ----------
+        state : tuple
+            The state returned by ``__getstate__``.
+        """
+        (
+            self._data_ref,
+            self.call_queue,
+            self._length_cache,
+            self._width_cache,
+            self._ip_cache,
+        ) = state
+        self._fusion_sources = []
+        self._fusion_consumers = None
+
+    @property
+    def _data(self):
+        """
+        Get the reference to the wrapped data, draining the call queue if needed.
+
+        Returns
+        -------
+        ray.ObjectRef
+        """
+        if len(self.call_queue):
+            self.drain_call_queue()
+        return self._data_ref
+
     def apply(self, func, *args, **kwargs):
         """
         Apply a function to the object wrapped by this partition.
@@ -93,13 +175,27 @@ class PandasOnRayDataframePartition(PandasDataframePartition):
         -----
         It does not matter if `func` is callable or an ``ray.ObjectRef``. Ray will
         handle it correctly either way. The keyword arguments are sent as a dictionary.
+
+        While the resulting call queue is shorter than ``TaskFusionThreshold``,
+        the remote task is not submitted and `func` is only added to the call queue
+        of the new partition, so the whole chain is later executed by a single task.
+        Otherwise, the pending call queue and `func` are executed by a single task,
+        except for the part of the queue that is shared with other live consumers,
+        which is executed and memoized first.
         """
-        log = get_logger()
-        self._is_debug(log) and log.debug(f"ENTER::Partition.apply::{self._identity}")
-        data = self._data
+        _IS_DEBUG and _LOGGER.debug(f"ENTER::Partition.apply::{self._identity}")
+        if len(self.call_queue) + 1 < TaskFusionThreshold.get():
+            _IS_DEBUG and _LOGGER.debug(f"DEFER::Partition.apply::{self._identity}")
+            return self._defer(func, args, kwargs)
+        shared_source = self._find_shared_fusion_source()
+        if shared_source is self:
+            self.drain_call_queue()
+        elif shared_source is not None:
+            self._rebase_on_fusion_source(shared_source)
+        data = self._data_ref
         call_queue = self.call_queue + [[func, args, kwargs]]
         if len(call_queue) > 1:
-            self._is_debug(log) and log.debug(
+            _IS_DEBUG and _LOGGER.debug(
                 f"SUBMIT::_apply_list_of_funcs::{self._identity}"
             )
             result, length, width, ip = _apply_list_of_funcs.remote(
@@ -108,30 +204,169 @@ class PandasOnRayDataframePartition(PandasDataframePartition):
         else:
             # We handle `len(call_queue) == 1` in a different way because
             # this dramatically improves performance.
-            func, f_args, f_kwargs = call_queue[0]
-            result, length, width, ip = _apply_func.remote(
-                data, func, *f_args, **f_kwargs
-            )
-            self._is_debug(log) and log.debug(f"SUBMIT::_apply_func::{self._identity}")
-        self._is_debug(log) and log.debug(f"EXIT::Partition.apply::{self._identity}")
+            _IS_DEBUG and _LOGGER.debug(f"SUBMIT::_apply_func::{self._identity}")
+            result, length, width, ip = _apply_func.remote(data, func, *args, **kwargs)
+        _IS_DEBUG and _LOGGER.debug(f"EXIT::Partition.apply::{self._identity}")
         return self.__constructor__(result, length, width, ip)
 
+    def add_to_apply_calls(self, func, *args, length=None, width=None, **kwargs):
+        """
+        Add a function to the call queue.
+
+        Parameters
+        ----------
+        func : callable or ray.ObjectRef
+            Function to be added to the call queue.
+        *args : iterable
+            Additional positional arguments to be passed in `func`.
+        length : ray.ObjectRef or int, optional
+            Length, or reference to length, of wrapped ``pandas.DataFrame``.
+        width : ray.ObjectRef or int, optional
+            Width, or reference to width, of wrapped ``pandas.DataFrame``.
+        **kwargs : dict
+            Additional keyword arguments to be passed in `func`.
+
+        Returns
+        -------
+        PandasOnRayDataframePartition
+            A new ``PandasOnRayDataframePartition`` object.
+        """
+        return self._defer(func, args, kwargs, length=length, width=width)
+
+    def _defer(self, func, args, kwargs, length=None, width=None):
+        """
+        Build a partition with `func` added to the pending call queue of this one.
+
+        Parameters
+        ----------
+        func : callable or ray.ObjectRef
+            Function to be added to the call queue.
+        args : tuple
+            Positional arguments to be passed in `func`.
+        kwargs : dict
+            Keyword arguments to be passed in `func`.
+        length : ray.ObjectRef or int, optional
+            Length, or reference to length, of the resulting ``pandas.DataFrame``.
+        width : ray.ObjectRef or int, optional
+            Width, or reference to width, of the resulting ``pandas.DataFrame``.
+
+        Returns
+        -------
+        PandasOnRayDataframePartition
+            A new ``PandasOnRayDataframePartition`` object.
+
+        Notes
+        -----
+        The new partition remembers this one as a fusion source, so the shared calls
+        are executed only once if this partition is still alive when the new one
+        drains its call queue, see ``_rebase_on_fusion_source``.
+        """
+        new_obj = self.__constructor__(
+            self._data_ref,
+            call_queue=self.call_queue + [[func, args, kwargs]],
+            length=length,
+            width=width,
+        )
+        self._register_fusion_source(new_obj)
+        return new_obj
+
+    def _register_fusion_source(self, new_obj):
+        """
+        Register this partition as a fusion source of `new_obj` sharing its call queue.
+
+        Parameters
+        ----------
+        new_obj : PandasOnRayDataframePartition
+            A partition whose call queue starts with the call queue of this one.
+        """
+        if len(self.call_queue) == 0:
+            return
+        new_obj._fusion_sources = self._fusion_sources + [
+            (weakref.ref(self), len(self.call_queue))
+        ]
+        for source_ref, _ in new_obj._fusion_sources:
+            source = source_ref()
+            if source is not None:
+                if source._fusion_consumers is None:
+                    source._fusion_consumers = weakref.WeakSet()
+                source._fusion_consumers.add(new_obj)
+
+    def _find_shared_fusion_source(self):
+        """
+        Find the closest partition whose pending calls are shared with another live consumer.
+
+        Returns
+        -------
+        PandasOnRayDataframePartition or None
+            This partition or one of its alive fusion sources, ``None`` if the pending
+            calls of this partition are not shared with other partitions.
+        """
+        lineage = [self]
+        for source_ref, _ in reversed(self._fusion_sources):
+            source = source_ref()
+            if source is not None:
+                lineage.append(source)
+        for candidate in lineage:
+            for consumer in candidate._fusion_consumers or ():
+                if any(consumer is part for part in lineage):
+                    continue
+                if any(ref() is candidate for ref, _ in consumer._fusion_sources):
+                    return candidate
+        return None
+
+    def _rebase_on_fusion_source(self, source=None):
+        """
+        Replace the call queue prefix shared with a fusion source by the source's result.
+
+        The source partition may have other consumers, so its call queue is drained
+        and memoized in it instead of being executed once per consumer. The pending
+        calls of sources that were already garbage collected are kept in the queue
+        of this partition and fused into its task.
+
+        Parameters
+        ----------
+        source : PandasOnRayDataframePartition, optional
+            The fusion source to rebase on. The closest alive one is used by default.
+        """
+        sources = self._fusion_sources
+        for idx in range(len(sources) - 1, -1, -1):
+            source_ref, prefix_len = sources[idx]
+            candidate = source_ref()
+            if candidate is None or (source is not None and candidate is not source):
+                continue
+            candidate.drain_call_queue()
+            self._data_ref = candidate._data_ref
+            self.call_queue = self.call_queue[prefix_len:]
+            self._fusion_sources = [
+                (ref, length - prefix_len) for ref, length in sources[idx + 1 :]
+            ]
+            if len(self.call_queue) == 0:
+                if not isinstance(self._length_cache, int):
+                    self._length_cache = candidate._length_cache
+                if not isinstance(self._width_cache, int):
+                    self._width_cache = candidate._width_cache
+                self._ip_cache = candidate._ip_cache
+            return
+
     def drain_call_queue(self):
         """Execute all operations stored in the call queue on the object wrapped by this partition."""
-        log = get_logger()
-        self._is_debug(log) and log.debug(
-            f"ENTER::Partition.drain_call_queue::{self._identity}"
-        )
         if len(self.call_queue) == 0:
             return
-        data = self._data
+        self._rebase_on_fusion_source()
+        self._fusion_sources = []
+        if len(self.call_queue) == 0:
+            return
+        _IS_DEBUG and _LOGGER.debug(
+            f"ENTER::Partition.drain_call_queue::{self._identity}"
+        )
+        data = self._data_ref
         call_queue = self.call_queue
         if len(call_queue) > 1:
-            self._is_debug(log) and log.debug(
+            _IS_DEBUG and _LOGGER.debug(
                 f"SUBMIT::_apply_list_of_funcs::{self._identity}"
             )
             (
-                self._data,
+                self._data_ref,
                 new_length,
                 new_width,
                 self._ip_cache,
@@ -140,14 +375,14 @@ class PandasOnRayDataframePartition(PandasDataframePartition):
             # We handle `len(call_queue) == 1` in a different way because
             # this dramatically improves performance.
             func, f_args, f_kwargs = call_queue[0]
-            self._is_debug(log) and log.debug(f"SUBMIT::_apply_func::{self._identity}")
+            _IS_DEBUG and _LOGGER.debug(f"SUBMIT::_apply_func::{self._identity}")
             (
-                self._data,
+                self._data_ref,
                 new_length,
                 new_width,
                 self._ip_cache,
             ) = _apply_func.remote(data, func, *f_args, **f_kwargs)
-        self._is_debug(log) and log.debug(
+        _IS_DEBUG and _LOGGER.debug(
             f"EXIT::Partition.drain_call_queue::{self._identity}"
         )
         self.call_queue = []
@@ -162,7 +397,7 @@ class PandasOnRayDataframePartition(PandasDataframePartition):
     def wait(self):
         """Wait completing computations on the object wrapped by the partition."""
         self.drain_call_queue()
-        RayWrapper.wait(self._data)
+        RayWrapper.wait(self._data_ref)
 
     def __copy__(self):
         """
@@ -173,13 +408,15 @@ class PandasOnRayDataframePartition(PandasDataframePartition):
         PandasOnRayDataframePartition
             A copy of this partition.
         """
-        return self.__constructor__(
-            self._data,
+        new_obj = self.__constructor__(
+            self._data_ref,
             length=self._length_cache,
             width=self._width_cache,
             ip=self._ip_cache,
             call_queue=self.call_queue,
         )
+        self._register_fusion_source(new_obj)
+        return new_obj
 
     def mask(self, row_labels, col_labels):
         """
@@ -197,30 +434,24 @@ class PandasOnRayDataframePartition(PandasDataframePartition):
         PandasOnRayDataframePartition
             A new ``PandasOnRayDataframePartition`` object.
         """
-        log = get_logger()
-        self._is_debug(log) and log.debug(f"ENTER::Partition.mask::{self._identity}")
+        _IS_DEBUG and _LOGGER.debug(f"ENTER::Partition.mask::{self._identity}")
         new_obj = super().mask(row_labels, col_labels)
+        # Sliced lengths that are not known locally are left empty, so they are
+        # returned by the task executing the mask when the call queue is drained
+        # instead of being computed by a separate task.
         if isinstance(row_labels, slice) and isinstance(
             self._length_cache, ObjectIDType
         ):
             if row_labels == slice(None):
                 # fast path - full axis take
                 new_obj._length_cache = self._length_cache
-            else:
-                new_obj._length_cache = compute_sliced_len.remote(
-                    row_labels, self._length_cache
-                )
         if isinstance(col_labels, slice) and isinstance(
             self._width_cache, ObjectIDType
         ):
             if col_labels == slice(None):
                 # fast path - full axis take
                 new_obj._width_cache = self._width_cache
-            else:
-                new_obj._width_cache = compute_sliced_len.remote(
-                    col_labels, self._width_cache
-                )
-        self._is_debug(log) and log.debug(f"EXIT::Partition.mask::{self._identity}")
+        _IS_DEBUG and _LOGGER.debug(f"EXIT::Partition.mask::{self._identity}")
         return new_obj
 
     @classmethod
@@ -238,7 +469,13 @@ class PandasOnRayDataframePartition(PandasDataframePartition):
         PandasOnRayDataframePartition
             A new ``PandasOnRayDataframePartition`` object.
         """
-        return cls(cls.execution_wrapper.put(obj), len(obj.index), len(obj.columns))
+        data = cls.execution_wrapper.put(obj)
+        # The object is put into the store of the current node, so its address is
+        # known locally unless we are connected to a remote cluster via Ray Client.
+        # The address is requested after the put that may have initialized Ray,
+        # so it is the one reported by the local node.
+        ip = None if ray_client.is_connected() else get_node_ip_address()
+        return cls(data, len(obj.index), len(obj.columns), ip=ip)
 
     @classmethod
     def preprocess_func(cls, func):
@@ -278,7 +515,7 @@ class PandasOnRayDataframePartition(PandasDataframePartition):
                 self.drain_call_queue()
             else:
                 self._length_cache, self._width_cache = _get_index_and_columns.remote(
-                    self._data
+                    self._data_ref
                 )
         if materialize and isinstance(self._length_cache, ObjectIDType):
             self._length_cache = RayWrapper.materialize(self._length_cache)
@@ -305,7 +542,7 @@ class PandasOnRayDataframePartition(PandasDataframePartition):
                 self.drain_call_queue()
             else:
                 self._length_cache, self._width_cache = _get_index_and_columns.remote(
-                    self._data
+                    self._data_ref
                 )
         if materialize and isinstance(self._width_cache, ObjectIDType):
             self._width_cache = RayWrapper.materialize(self._width_cache)
@@ -331,7 +568,9 @@ class PandasOnRayDataframePartition(PandasDataframePartition):
             if len(self.call_queue):
                 self.drain_call_queue()
             else:
-                self._ip_cache = self.apply(lambda df: pandas.DataFrame([]))._ip_cache
+                self._ip_cache = self.apply(lambda df: pandas.DataFrame([])).ip(
+                    materialize=False
+                )
         if materialize and isinstance(self._ip_cache, ObjectIDType):
             self._ip_cache = RayWrapper.materialize(self._ip_cache)
         return self._ip_cache
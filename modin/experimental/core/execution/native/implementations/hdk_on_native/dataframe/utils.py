@@ -17,7 +17,7 @@ import re
 import typing
 from collections import OrderedDict
 from functools import lru_cache
-from typing import Any, List, Tuple, Union
+from typing import Any, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas
@@ -42,19 +42,16 @@ class ColNameCodec:
     _RESERVED_NAMES = (MODIN_UNNAMED_SERIES_LABEL, ROWID_COL_NAME)
     _COL_TYPES = Union[str, int, float, Timestamp, None]
     _COL_NAME_TYPE = Union[_COL_TYPES, Tuple[_COL_TYPES, ...]]
+    _UNCACHED_TYPES = frozenset((float, Timestamp))
 
     def _encode_tuple(values: Tuple[_COL_TYPES, ...]) -> str:  # noqa: GL08
-        dst = ["_T"]
-        count = len(values)
-        for value in values:
-            if isinstance(value, str):
-                dst.append(value.replace("_", "_Q"))
-            else:
-                dst.append(ColNameCodec._ENCODERS[type(value)](value))
-            count -= 1
-            if count != 0:
-                dst.append("_T")
-        return "".join(dst)
+        encoders = ColNameCodec._ENCODERS
+        return "_T" + "_T".join(
+            value.replace("_", "_Q")
+            if isinstance(value, str)
+            else encoders[type(value)](value)
+            for value in values
+        )
 
     def _decode_tuple(encoded: str) -> Tuple[_COL_TYPES, ...]:  # noqa: GL08
         items = []
@@ -89,7 +86,6 @@ class ColNameCodec:
     }
 
     @staticmethod
-    @lru_cache(1024)
     def encode(
         name: _COL_NAME_TYPE,
         ignore_reserved: bool = True,
@@ -112,6 +108,20 @@ class ColNameCodec:
         str
             Encoded name.
         """
+        # Names that can't be cached are encoded on every call, see ``_encode_cached``
+        if type(name) is tuple:
+            return ColNameCodec._encode_tuple_cached(*name) or ColNameCodec._encode(
+                name, ignore_reserved
+            )
+        return ColNameCodec._encode_cached(
+            name, ignore_reserved
+        ) or ColNameCodec._encode(name, ignore_reserved)
+
+    @staticmethod
+    def _encode(
+        name: _COL_NAME_TYPE,
+        ignore_reserved: bool,
+    ) -> str:  # noqa: GL08
         if (
             ignore_reserved
             and isinstance(name, str)
@@ -127,6 +137,28 @@ class ColNameCodec:
         except KeyError:
             raise TypeError(f"Unsupported column name: {name}")
 
+    @staticmethod
+    @lru_cache(1024, typed=True)
+    def _encode_cached(
+        name: _COL_TYPES,
+        ignore_reserved: bool,
+    ) -> Optional[str]:  # noqa: GL08
+        # The cache is typed, so equal names of different types, e.g. 1 and 1.0, are
+        # cached separately. Equal floats and timestamps may still be encoded
+        # differently, e.g. 0.0 and -0.0 or the same moment in different time zones,
+        # so ``None`` is cached for them and they are encoded on every call.
+        if type(name) in ColNameCodec._UNCACHED_TYPES:
+            return None
+        return ColNameCodec._encode(name, ignore_reserved)
+
+    @staticmethod
+    @lru_cache(1024, typed=True)
+    def _encode_tuple_cached(*items: _COL_TYPES) -> Optional[str]:  # noqa: GL08
+        # The items are passed as separate arguments to make the cache typed per item
+        if not ColNameCodec._UNCACHED_TYPES.isdisjoint(map(type, items)):
+            return None
+        return ColNameCodec._encode(items, False)
+
     @staticmethod
     @lru_cache(1024)
     def decode(name: str) -> _COL_NAME_TYPE:
@@ -291,8 +323,14 @@ def build_categorical_from_at(table, column_name):
     pandas.CategoricalDtype
     """
     chunks = table.column(column_name).chunks
-    cat = pandas.concat([chunk.dictionary.to_pandas() for chunk in chunks])
-    return pandas.CategoricalDtype(cat.unique())
+    dicts = [chunk.dictionary for chunk in chunks]
+    first = dicts[0]
+    if all(d.equals(first) for d in dicts[1:]):
+        # The dictionaries are usually unified across the chunks
+        cat = first.unique()
+    else:
+        cat = pa.concat_arrays(dicts).unique()
+    return pandas.CategoricalDtype(cat.to_pandas())
 
 
 def check_join_supported(join_type: str):
@@ -16,9 +16,11 @@ import timeit
 from random import choice, randint, uniform
 
 import pandas
+import pyarrow as pa
+import pytest
 import pytz
 
-from ..dataframe.utils import ColNameCodec
+from ..dataframe.utils import ColNameCodec, build_categorical_from_at
 
 UNICODE_RANGES = [
     (0x0020, 0x007F),  # Basic Latin
@@ -44,6 +46,30 @@ def test_encode_col_name():
     test(None)
     test(("", ""))
 
+    # names that are equal, but of different types, must not share cache entries
+    for name in (1, 1.0, (1,), (1.0,)):
+        test(name)
+        decoded = ColNameCodec.decode(ColNameCodec.encode(name))
+        if isinstance(name, tuple):
+            name, decoded = name[0], decoded[0]
+        assert type(decoded) is type(name)
+
+    # names of the same type that compare equal must not share cache entries as well
+    utc = pandas.Timestamp("2020-01-01", tz="UTC")
+    paris = pandas.Timestamp("2020-01-01 01:00", tz="Europe/Paris")
+    for name, expected in (
+        (0.0, "_F0.0"),
+        (-0.0, "_F-0.0"),
+        ((0.0,), "_T_F0.0"),
+        ((-0.0,), "_T_F-0.0"),
+        (utc, "_D1577836800.0_UTC"),
+        (paris, "_D1577836800.0_Europe/Paris"),
+        (("a", utc), "_Ta_T_D1577836800.0_UTC"),
+        (("a", paris), "_Ta_T_D1577836800.0_Europe/Paris"),
+    ):
+        test(name)
+        assert ColNameCodec.encode(name) == expected
+
     for i in range(0, 1000):
         test(randint(-sys.maxsize, sys.maxsize))
     for i in range(0, 1000):
@@ -61,6 +87,52 @@ def rnd_unicode(length):
     return "".join(choice(UNICODE_ALPHABET) for _ in range(length))
 
 
+@pytest.mark.parametrize(
+    "chunks",
+    [
+        # different dictionaries
+        [["b", "a", "b"], ["c", "a"], ["d", "c", "b"]],
+        # identical dictionaries
+        [["b", "a", "c"], ["b", "a", "c"]],
+        # non-string values
+        [[3.5, 1.0, 2.0], [2.0, 5.0], [1.0, 0.5]],
+        [[3, 1, 2], [3, 1, 2]],
+    ],
+)
+def test_build_categorical_from_at(chunks):
+    dicts = [pa.array(chunk) for chunk in chunks]
+    col = pa.chunked_array(
+        [
+            pa.DictionaryArray.from_arrays(pa.array(range(len(d)), pa.int32()), d)
+            for d in dicts
+        ]
+    )
+    table = pa.table({"col": col})
+    expected = pandas.concat(
+        [chunk.dictionary.to_pandas() for chunk in col.chunks]
+    ).unique()
+
+    dtype = build_categorical_from_at(table, "col")
+    assert isinstance(dtype, pandas.CategoricalDtype)
+    assert list(dtype.categories) == list(expected)
+    assert dtype.categories.dtype == expected.dtype
+
+
+def test_encode_cache_time():
+    # a cache hit must be faster than encoding the name from scratch
+    for name in ("col_1", 1, ("a", "b"), ("a", "b", "c", 1)):
+        ColNameCodec.encode(name)
+        cached = min(
+            timeit.repeat(lambda: ColNameCodec.encode(name), number=1000, repeat=5)
+        )
+        uncached = min(
+            timeit.repeat(
+                lambda: ColNameCodec._encode(name, True), number=1000, repeat=5
+            )
+        )
+        assert cached < uncached, f"{name!r}: {cached} >= {uncached}"
+
+
 def test_time():
     ranges = [
         (0x0041, 0x005A),  # Alpha chars
@@ -11,6 +11,7 @@
 # ANY KIND, either express or implied. See the License for the specific language
 # governing permissions and limitations under the License.
 
+import contextlib
 import functools
 import sys
 import unittest.mock as mock
@@ -20,7 +21,13 @@ import pandas
 import pytest
 
 import modin.pandas as pd
-from modin.config import Engine, ExperimentalGroupbyImpl, MinPartitionSize, NPartitions
+from modin.config import (
+    Engine,
+    ExperimentalGroupbyImpl,
+    MinPartitionSize,
+    NPartitions,
+    TaskFusionThreshold,
+)
 from modin.core.dataframe.pandas.dataframe.utils import ColumnInfo, ShuffleSortFunctions
 from modin.core.storage_formats.pandas.utils import split_result_of_axis_func_pandas
 from modin.distributed.dataframe.pandas import from_partitions
@@ -1511,3 +1518,192 @@ def test_call_queue_serialization(call_queue):
 
     assert call_queue == reconstructed_queue
     assert_everything_materialized(reconstructed_queue)
+
+
+@contextlib.contextmanager
+def count_submitted_tasks():
+    """Count the tasks submitted by Ray partitions to apply functions."""
+    from modin.core.execution.ray.implementations.pandas_on_ray.partitioning import (
+        partition as partition_module,
+    )
+
+    with mock.patch.object(
+        partition_module, "_apply_func", wraps=partition_module._apply_func
+    ) as apply_func, mock.patch.object(
+        partition_module,
+        "_apply_list_of_funcs",
+        wraps=partition_module._apply_list_of_funcs,
+    ) as apply_list_of_funcs:
+        yield lambda: (
+            apply_func.remote.call_count + apply_list_of_funcs.remote.call_count
+        )
+
+
+@pytest.mark.skipif(
+    Engine.get() != "Ray",
+    reason="Task fusion is only implemented for Ray engine.",
+)
+def test_apply_fuses_pending_call_queue():
+    data = pandas.DataFrame({"a": range(6), "b": range(6)})
+    partition = block_partition_class.put(data)
+
+    with count_submitted_tasks() as num_tasks:
+        result = partition.mask(slice(1, 5), slice(None)).apply(lambda df: df + 1)
+        df_equals(result.to_pandas(), data.iloc[1:5] + 1)
+    assert num_tasks() == 1
+
+
+@pytest.mark.skipif(
+    Engine.get() != "Ray",
+    reason="Task fusion is only implemented for Ray engine.",
+)
+@pytest.mark.parametrize("modify_config", [{TaskFusionThreshold: 3}], indirect=True)
+def test_apply_task_fusion(modify_config):
+    data = pandas.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+    partition = block_partition_class.put(data)
+
+    with count_submitted_tasks() as num_tasks:
+        first = partition.apply(lambda df: df + 1)
+        second = first.apply(lambda df: df * 2)
+        # both calls are postponed until the queue reaches the threshold
+        assert len(first.call_queue) == 1
+        assert len(second.call_queue) == 2
+
+        third = second.apply(lambda df: df - 1)
+        assert len(third.call_queue) == 0
+        df_equals(third.to_pandas(), (data + 1) * 2 - 1)
+    # the whole chain is executed by a single task
+    assert num_tasks() == 1
+
+    # accessing the data reference executes the pending call queue
+    second._data
+    assert len(second.call_queue) == 0
+    df_equals(second.to_pandas(), (data + 1) * 2)
+
+
+@pytest.mark.skipif(
+    Engine.get() != "Ray",
+    reason="Task fusion is only implemented for Ray engine.",
+)
+@pytest.mark.parametrize("modify_config", [{TaskFusionThreshold: 4}], indirect=True)
+def test_apply_task_fusion_with_multiple_consumers(modify_config):
+    import ray
+
+    @ray.remote
+    class Counter:
+        def __init__(self):
+            self.value = 0
+
+        def increment(self):
+            self.value += 1
+
+        def get(self):
+            return self.value
+
+    def count_calls(counter):
+        def func(df):
+            ray.get(counter.increment.remote())
+            return df + 1
+
+        return func
+
+    data = pandas.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+
+    # the pending call of the source is executed once for all of its consumers,
+    # both deferred and eagerly dispatched ones
+    counter = Counter.remote()
+    source = block_partition_class.put(data).apply(count_calls(counter))
+    consumers = [source.apply(lambda df, i=i: df * i) for i in range(3)]
+    consumers.append(consumers[0].apply(lambda df: df + 1).apply(lambda df: df - 1))
+    assert len(consumers[-1].call_queue) == 0
+    for i, consumer in enumerate(consumers):
+        df_equals(consumer.to_pandas(), (data + 1) * (i % 3))
+    assert ray.get(counter.get.remote()) == 1
+
+    # a consumer of a collected source executes the whole chain by itself
+    counter = Counter.remote()
+    result = (
+        block_partition_class.put(data)
+        .apply(count_calls(counter))
+        .apply(lambda df: df * 2)
+    )
+    assert len(result.call_queue) == 2
+    df_equals(result.to_pandas(), (data + 1) * 2)
+    assert ray.get(counter.get.remote()) == 1
+
+    # the same goes for a frame consumed by several operations
+    counter = Counter.remote()
+    md_df, pd_df = create_test_dfs(np.arange(100).reshape(10, 10))
+    md_df = md_df.map(count_calls(counter))
+    for op in ("sum", "max", "min", "mean"):
+        df_equals(getattr(md_df, op)(), getattr(pd_df + 1, op)())
+    assert ray.get(counter.get.remote()) == pd_df.size
+
+
+@pytest.mark.skipif(
+    Engine.get() != "Ray",
+    reason="Only Ray partitions define a custom pickling state.",
+)
+def test_partition_serialization():
+    data = pandas.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+    partition = block_partition_class.put(data).add_to_apply_calls(lambda df: df + 1)
+
+    restored = RayWrapper.materialize(put(partition))
+    assert type(restored) is type(partition)
+    assert restored._length_cache is None
+    assert len(restored.call_queue) == 1
+    df_equals(restored.to_pandas(), data + 1)
+
+
+@pytest.mark.parametrize("axis", [0, 1])
+def test_tree_reduce_propagates_partition_shape(axis):
+    md_df, pd_df = create_test_dfs(test_data_values[0])
+    modin_frame = md_df._query_compiler._modin_frame
+    result = modin_frame.tree_reduce(axis, lambda df: df.sum(axis=axis))
+
+    cache_name = "_width_cache" if axis else "_length_cache"
+    for part in result._partitions.flatten():
+        assert getattr(part, cache_name) == 1
+    np.testing.assert_allclose(
+        result.to_pandas().squeeze(axis).to_numpy(), pd_df.sum(axis=axis).to_numpy()
+    )
+
+
+@pytest.mark.parametrize("axis", [0, 1])
+def test_get_axis_sizes(axis):
+    md_df, pd_df = create_test_dfs(test_data_values[0])
+    modin_frame = md_df._query_compiler._modin_frame
+    parts = modin_frame._partitions.T[0] if axis == 0 else modin_frame._partitions[0]
+    for part in parts:
+        part._length_cache = None
+        part._width_cache = None
+
+    sizes = modin_frame._partition_mgr_cls.get_axis_sizes(parts, axis=axis)
+    assert sum(sizes) == pd_df.shape[axis]
+    cache_name = "_width_cache" if axis else "_length_cache"
+    for part, size in zip(parts, sizes):
+        assert getattr(part, cache_name) == size
+
+    # concatenation of many small frames rebalances them into virtual partitions
+    md_df = pd.concat([pd.DataFrame({"a": range(10), "b": range(10)})] * 20)
+    modin_frame = md_df._query_compiler._modin_frame
+    parts = modin_frame._partitions.T[0] if axis == 0 else modin_frame._partitions[0]
+    assert all(isinstance(part, virtual_column_partition_class) for part in parts)
+    for part in parts:
+        part._length_cache = None
+        part._width_cache = None
+
+    sizes = modin_frame._partition_mgr_cls.get_axis_sizes(parts, axis=axis)
+    assert sum(sizes) == md_df.shape[axis]
+
+
+@pytest.mark.skipif(
+    Engine.get() != "Ray",
+    reason="Only Ray partitions cache the node IP address on put.",
+)
+def test_put_caches_node_ip():
+    from ray.util import get_node_ip_address
+
+    partition = block_partition_class.put(pandas.DataFrame({"a": [1, 2, 3]}))
+    assert partition._ip_cache == get_node_ip_address()
+    assert partition.ip() == get_node_ip_address()